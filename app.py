@@ -5,13 +5,20 @@ Web-based control panel with python-vlc backend.
 """
 
 import os
-import json
+import re
+import atexit
 import time
+import random
+import hashlib
+import hmac
 import shutil
 import threading
+import queue
 import signal
 import sys
 import subprocess
+from collections import deque
+from datetime import datetime
 from pathlib import Path
 from functools import wraps
 
@@ -19,8 +26,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import orjson
 import vlc
-from flask import Flask, render_template, request, jsonify, send_from_directory, session, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, session, redirect, url_for
+from flask.json.provider import JSONProvider
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
 import secrets
@@ -31,9 +40,31 @@ import secrets
 BASE_DIR = Path(__file__).resolve().parent
 VIDEO_DIR = BASE_DIR / "videos"
 PLAYLIST_FILE = BASE_DIR / "playlist.json"
-ALLOWED_EXTENSIONS = {"mp4", "avi", "mkv", "mov", "wmv", "flv", "webm", "ts", "m4v"}
+PLAYLIST_SAVE_DELAY = 0.5  # seconds to coalesce playlist writes
+STATUS_CACHE_SEC = 0.2  # polls within this window share one VLC query
+STATUS_PUSH_INTERVAL = 0.5  # seconds between status pushes to SSE clients
+PREFETCH_AT = 0.9  # playback position at which the next video is preloaded
+PREFETCH_BYTES = 16 * 1024 * 1024  # how much of the next file to pull into page cache
+ALLOWED_EXTENSIONS = frozenset({"mp4", "avi", "mkv", "mov", "wmv", "flv", "webm", "ts", "m4v"})
+_ALLOWED_SUFFIXES = tuple("." + e for e in ALLOWED_EXTENSIONS)  # for str.endswith
+UPLOAD_BUFFER_SIZE = 1024 * 1024  # 1 MB copy blocks for video uploads
+UPLOAD_PARTS_DIR = VIDEO_DIR / ".parts"  # chunked uploads in progress
+MAX_UPLOAD_CHUNKS = 10000
+UPLOAD_PARTS_MAX_AGE = 24 * 3600  # seconds before an abandoned upload is swept
+
+
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() and request.get_json() through orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config["MAX_CONTENT_LENGTH"] = 2 * 1024 * 1024 * 1024  # 2 GB upload limit
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "change-this-secret-key")
 
@@ -48,31 +79,90 @@ if PASSWORD.startswith(_KNOWN_HASH_PREFIXES):
 else:
     PASSWORD_HASH = generate_password_hash(PASSWORD)
 
+# SHA-256 of the last password that passed the (deliberately slow) hash
+# check, so repeat logins skip scrypt/pbkdf2. Only a digest is kept.
+_verified_password_digest: bytes | None = None
+
+
+def _check_password(password: str) -> bool:
+    """Verify the dashboard password, short-circuiting repeat logins."""
+    global _verified_password_digest
+    digest = hashlib.sha256(password.encode()).digest()
+    cached = _verified_password_digest
+    if cached is not None and hmac.compare_digest(digest, cached):
+        return True
+    if check_password_hash(PASSWORD_HASH, password):
+        _verified_password_digest = digest
+        return True
+    return False
+
+
+_USERNAME_DIGEST = hashlib.sha256(USERNAME.encode()).digest()
+
+
+def _check_credentials(username: str, password: str) -> bool:
+    """Constant-time username check plus password verification."""
+    user_ok = hmac.compare_digest(hashlib.sha256(username.encode()).digest(), _USERNAME_DIGEST)
+    if not user_ok:
+        # Always pay for the full hash here: the repeat-login fast path in
+        # _check_password would otherwise reveal a correct password on its own
+        check_password_hash(PASSWORD_HASH, password)
+        return False
+    return _check_password(password)
+
+
 # ---------------------------------------------------------------------------
 # Rate limiting for login
 # ---------------------------------------------------------------------------
-_login_attempts: dict[str, list[float]] = {}
+_login_attempts: dict[str, deque[float]] = {}
+_login_attempts_lock = threading.Lock()
 _LOGIN_MAX_ATTEMPTS = 5
 _LOGIN_WINDOW_SEC = 300  # 5 minutes
+_LOGIN_MAX_TRACKED_IPS = 1024  # start evicting stale IPs beyond this
 
 
 def _is_rate_limited(ip: str) -> bool:
     """Check if an IP has exceeded login attempt limits."""
-    now = time.time()
-    attempts = _login_attempts.get(ip, [])
-    # Remove old attempts outside the window
-    attempts = [t for t in attempts if now - t < _LOGIN_WINDOW_SEC]
-    _login_attempts[ip] = attempts
-    return len(attempts) >= _LOGIN_MAX_ATTEMPTS
+    with _login_attempts_lock:
+        attempts = _login_attempts.get(ip)
+        if not attempts:
+            return False
+        # Drop attempts outside the window (oldest are on the left)
+        cutoff = time.time() - _LOGIN_WINDOW_SEC
+        while attempts and attempts[0] <= cutoff:
+            attempts.popleft()
+        if not attempts:
+            del _login_attempts[ip]
+            return False
+        return len(attempts) >= _LOGIN_MAX_ATTEMPTS
+
+
+def _evict_stale_attempts():
+    """Drop IPs whose newest attempt is outside the window. Caller holds the lock."""
+    cutoff = time.time() - _LOGIN_WINDOW_SEC
+    stale = [ip for ip, attempts in _login_attempts.items() if not attempts or attempts[-1] <= cutoff]
+    for ip in stale:
+        del _login_attempts[ip]
 
 
 def _record_attempt(ip: str):
     """Record a failed login attempt."""
-    _login_attempts.setdefault(ip, []).append(time.time())
+    with _login_attempts_lock:
+        _login_attempts.setdefault(ip, deque()).append(time.time())
+        # Bound memory when many distinct IPs fail; sample so the O(n)
+        # scan is amortized across requests
+        if len(_login_attempts) > _LOGIN_MAX_TRACKED_IPS and random.random() < 0.01:
+            _evict_stale_attempts()
+
+
+def _clear_attempts(ip: str):
+    """Forget failed login attempts after a successful login."""
+    with _login_attempts_lock:
+        _login_attempts.pop(ip, None)
 
 @app.before_request
 def csrf_protect():
-    if request.method == "POST" and request.endpoint != "api_login":
+    if request.method in ("POST", "PUT") and request.endpoint != "api_login":
         token = session.get("csrf_token")
         request_token = request.form.get("csrf_token")
         if not request_token:
@@ -83,16 +173,35 @@ def csrf_protect():
                 return jsonify({"error": error_msg}), 403
             return error_msg, 403
 
+def _csrf_token() -> str:
+    token = session.get("csrf_token")
+    if token is None:
+        # Only the first page of a fresh session mints a token (and thus
+        # modifies the session cookie); login rotates it afterwards
+        token = session["csrf_token"] = secrets.token_hex(32)
+    return token
+
 @app.context_processor
 def inject_csrf_token():
-    if "csrf_token" not in session:
-        session["csrf_token"] = secrets.token_hex(32)
-    return dict(csrf_token=session["csrf_token"])
+    return dict(csrf_token=_csrf_token())
 
 # ---------------------------------------------------------------------------
 # VLC Player Wrapper
 # ---------------------------------------------------------------------------
 
+# Keyed by the enum's integer value: plain int hashing avoids the
+# Python-level __hash__/__eq__ of vlc.State on every status query
+_STATE_NAMES = {
+    0: "NothingSpecial",
+    1: "Opening",
+    2: "Buffering",
+    3: "Playing",
+    4: "Paused",
+    5: "Stopped",
+    6: "Ended",
+    7: "Error",
+}
+
 class SignagePlayer:
     """Wraps python-vlc to manage a looping playlist for digital signage."""
 
@@ -118,15 +227,43 @@ class SignagePlayer:
 
         # Playlist state
         self.playlist: list[dict] = []   # ordered list of dicts
+        self._by_name: dict[str, dict] = {}  # filename -> playlist item, for O(1) lookups
+        self._media: dict[str, vlc.Media] = {}  # filename -> reusable VLC media
         self.current_index: int = 0
         self.is_looping: bool = True
         self.auto_play: bool = True     # auto-play on boot for signage
 
         self._lock = threading.Lock()
+        # Guards the (playlist, current_index) pair read by status(), so
+        # dashboard polls never wait on _lock while VLC is switching media
+        self._state_lock = threading.Lock()
+
+        # Cached status snapshot; the generation changes with its content
+        self._status_lock = threading.Lock()
+        self._status_cache: tuple[dict, str] | None = None
+        self._status_ts = 0.0
+        self._status_generation = 0
         
         # State control
         self._is_playing_state = False
         self._next_event = threading.Event()
+        self._prefetched = False
+        self._prefetch_event = threading.Event()
+        self._fullscreen_event = threading.Event()
+
+        # Items the scheduler must watch (scheduled or disabled); when
+        # there are none it idles and is woken by _schedule_event
+        self._scheduled_count = 0
+        self._schedule_event = threading.Event()
+
+        # Playlist writes are coalesced and flushed by a background thread;
+        # the version doubles as the /api/playlist ETag
+        self.playlist_version = 0
+        self._dirty = False
+        self._dirty_event = threading.Event()
+        # Serialises writers (saver thread, release) without holding _lock
+        # across disk I/O
+        self._save_lock = threading.Lock()
 
         # Load saved playlist
         self._load_playlist()
@@ -134,6 +271,8 @@ class SignagePlayer:
         # Attach end-reached event so we can advance to the next video
         events = self.player.event_manager()
         events.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end_reached)
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, self._on_playing)
+        events.event_attach(vlc.EventType.MediaPlayerPositionChanged, self._on_position_changed)
 
         # Start background threads
         self._playback_thread = threading.Thread(target=self._playback_loop, daemon=True)
@@ -142,6 +281,15 @@ class SignagePlayer:
         self._scheduler_thread = threading.Thread(target=self._schedule_checker, daemon=True)
         self._scheduler_thread.start()
 
+        self._saver_thread = threading.Thread(target=self._playlist_saver, daemon=True)
+        self._saver_thread.start()
+
+        self._prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+        self._prefetch_thread.start()
+
+        self._fullscreen_thread = threading.Thread(target=self._fullscreen_loop, daemon=True)
+        self._fullscreen_thread.start()
+
         # Auto-play on startup if enabled and playlist is not empty
         if self.auto_play and self.playlist:
             def _delayed_autoplay():
@@ -154,9 +302,11 @@ class SignagePlayer:
 
     def _load_playlist(self):
         """Load playlist from JSON file, falling back to directory scan."""
+        # Only rewrite the file when it differs from what we loaded
+        changed = True
         if self.playlist_file.exists():
             try:
-                data = json.loads(self.playlist_file.read_text())
+                data = orjson.loads(self.playlist_file.read_bytes())
                 raw_playlist = data.get("playlist", [])
                 parsed = []
                 for item in raw_playlist:
@@ -165,30 +315,96 @@ class SignagePlayer:
                     elif isinstance(item, dict) and "filename" in item:
                         parsed.append(item)
                 
-                self.playlist = [p for p in parsed if (self.video_dir / p["filename"]).is_file()]
+                existing = self._files_on_disk()
+                self.playlist = [p for p in parsed if p["filename"] in existing]
                 self.is_looping = data.get("loop", True)
                 self.auto_play = data.get("auto_play", True)
-            except (json.JSONDecodeError, KeyError):
+                # Legacy string entries, unreadable entries and missing files
+                # all mean the file needs rewriting
+                changed = len(self.playlist) != len(raw_playlist) or any(isinstance(i, str) for i in raw_playlist)
+            except (orjson.JSONDecodeError, KeyError):
                 self.playlist = []
         if not self.playlist:
             self.playlist = self._scan_videos()
-        self._save_playlist()
+            changed = True
+        for item in self.playlist:
+            self._cache_schedule(item)
+        self._by_name = {p["filename"]: p for p in self.playlist}
+        self._recount_scheduled()
+        if changed:
+            self._save_playlist()
 
     def _save_playlist(self):
-        """Persist current playlist order to disk."""
-        data = {
-            "playlist": self.playlist,
-            "loop": self.is_looping,
-            "auto_play": self.auto_play,
-        }
-        self.playlist_file.write_text(json.dumps(data, indent=2))
+        """Mark the playlist as changed; the saver thread persists it."""
+        self.playlist_version += 1
+        self._dirty = True
+        self._dirty_event.set()
+
+    def _flush_playlist(self):
+        """Write the playlist to disk if it changed since the last flush."""
+        with self._save_lock:
+            # Snapshot under the playlist lock, write after releasing it so
+            # a slow SD card never stalls playback or status requests
+            with self._lock:
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = {
+                    "playlist": [self._public_item(p) for p in self.playlist],
+                    "loop": self.is_looping,
+                    "auto_play": self.auto_play,
+                }
+            try:
+                self._persist(snapshot)
+            except OSError:
+                # Let the saver retry after its usual delay
+                with self._lock:
+                    self._dirty = True
+                self._dirty_event.set()
+                raise
+
+    def _persist(self, data: dict):
+        """Atomically write playlist data to the playlist file."""
+        # Write and fsync a temp file, then rename it over the old one,
+        # so a power cut leaves either the old or the new playlist
+        tmp = self.playlist_file.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.playlist_file)
+
+    def _playlist_saver(self):
+        while True:
+            self._dirty_event.wait()
+            self._dirty_event.clear()
+            time.sleep(PLAYLIST_SAVE_DELAY)  # let bursts of edits pile up
+            try:
+                self._flush_playlist()
+            except OSError as e:
+                print(f"Error saving playlist: {e}")
+
+    def _files_on_disk(self) -> set[str]:
+        """Names of regular files in the video directory, from one directory read."""
+        with os.scandir(self.video_dir) as it:
+            return {e.name for e in it if e.is_file()}
+
+    @staticmethod
+    def _sorted_video_entries(directory: Path) -> list[os.DirEntry]:
+        """Video files in a directory as DirEntry objects, sorted by name."""
+        with os.scandir(directory) as it:
+            entries = [
+                e for e in it
+                if e.name.lower().endswith(_ALLOWED_SUFFIXES) and e.is_file()
+            ]
+        entries.sort(key=lambda e: e.name)
+        return entries
 
     def _scan_videos(self) -> list[dict]:
         """Return sorted list of video dictionary configs in the video directory."""
         files = []
-        for f in sorted(self.video_dir.iterdir()):
-            if f.suffix.lstrip(".").lower() in ALLOWED_EXTENSIONS:
-                files.append({"filename": f.name, "active": True, "schedule": {}})
+        for e in self._sorted_video_entries(self.video_dir):
+            files.append({"filename": e.name, "active": True, "schedule": {}})
         return files
 
     # -- VLC event handlers & Playback loop ----------------------------------
@@ -197,44 +413,124 @@ class SignagePlayer:
         """Called when a single media finishes playing."""
         self._next_event.set()
 
-    def _is_valid(self, item: dict) -> bool:
+    def _on_position_changed(self, event):
+        """Kick off preloading of the next video near the end of this one."""
+        if not self._prefetched and event.u.new_position >= PREFETCH_AT:
+            self._prefetched = True
+            self._prefetch_event.set()
+
+    def _prefetch_loop(self):
+        while True:
+            self._prefetch_event.wait()
+            self._prefetch_event.clear()
+            with self._lock:
+                if len(self.playlist) < 2:
+                    continue
+                now = datetime.now()
+                index = self.current_index
+                for _ in range(len(self.playlist) - 1):
+                    index = (index + 1) % len(self.playlist)
+                    if self._is_valid(self.playlist[index], now):
+                        break
+                filename = self.playlist[index]["filename"]
+                # Warm the demuxer: probe headers before VLC has to open it
+                self._media_for(filename).parse_with_options(vlc.MediaParseFlag.local, -1)
+            # Read the start of the file into the page cache ahead of time
+            try:
+                fd = os.open(self.video_dir / filename, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+    def _on_playing(self, event):
+        """Have the fullscreen thread apply 16:9 fullscreen to the new media."""
+        # libvlc is not reentrant: calling the player from its own event
+        # callback can deadlock against stop()/set_media() under _lock
+        self._fullscreen_event.set()
+
+    def _fullscreen_loop(self):
+        while True:
+            self._fullscreen_event.wait()
+            self._fullscreen_event.clear()
+            self.player.video_set_aspect_ratio("16:9")
+            self.player.set_fullscreen(True)
+
+    @staticmethod
+    def _parse_schedule(sched) -> tuple:
+        """Parse a schedule dict into (start_date, end_date, start_time, end_time).
+
+        Missing or malformed fields become None.
+        """
+        if not sched or not isinstance(sched, dict):
+            return (None, None, None, None)
+
+        def parse(key, fmt):
+            value = sched.get(key)
+            if not value:
+                return None
+            try:
+                return datetime.strptime(value, fmt)
+            except (TypeError, ValueError):
+                return None
+
+        start_date = parse("start_date", "%Y-%m-%d")
+        end_date = parse("end_date", "%Y-%m-%d")
+        start_time = parse("start_time", "%H:%M")
+        end_time = parse("end_time", "%H:%M")
+        return (
+            start_date.date() if start_date else None,
+            end_date.date() if end_date else None,
+            start_time.time() if start_time else None,
+            end_time.time() if end_time else None,
+        )
+
+    def _cache_schedule(self, item: dict) -> dict:
+        """Store the parsed schedule on the item so _is_valid skips strptime."""
+        item["_sched"] = self._parse_schedule(item.get("schedule"))
+        return item
+
+    def _recount_scheduled(self):
+        """Count items the scheduler needs to check and wake it if any."""
+        self._scheduled_count = sum(
+            1 for p in self.playlist
+            if not p.get("active", True) or any(p.get("_sched") or ())
+        )
+        if self._scheduled_count:
+            self._schedule_event.set()
+
+    @staticmethod
+    def _public_item(item: dict) -> dict:
+        """Return the item without its cached, non-persisted fields."""
+        return {k: v for k, v in item.items() if k != "_sched"}
+
+    def _is_valid(self, item: dict, now: datetime | None = None) -> bool:
         if not item.get("active", True):
             return False
-            
-        sched = item.get("schedule", {})
-        if not sched:
+
+        sched = item.get("_sched")
+        if sched is None:
+            sched = self._parse_schedule(item.get("schedule"))
+        start_date, end_date, start_time, end_time = sched
+        if not any(sched):
             return True
-            
-        from datetime import datetime
-        now = datetime.now()
-        
-        start_date_str = sched.get("start_date")
-        end_date_str = sched.get("end_date")
-        start_time_str = sched.get("start_time")
-        end_time_str = sched.get("end_time")
 
-        if start_date_str:
-            try:
-                if now.date() < datetime.strptime(start_date_str, "%Y-%m-%d").date():
-                    return False
-            except ValueError: pass
-        if end_date_str:
-            try:
-                if now.date() > datetime.strptime(end_date_str, "%Y-%m-%d").date():
-                    return False
-            except ValueError: pass
+        if now is None:
+            now = datetime.now()
+        today = now.date()
+        now_time = now.time()
+
+        if start_date and today < start_date:
+            return False
+        if end_date and today > end_date:
+            return False
+        if start_time and now_time < start_time:
+            return False
+        if end_time and now_time > end_time:
+            return False
 
-        if start_time_str:
-            try:
-                if now.time() < datetime.strptime(start_time_str, "%H:%M").time():
-                    return False
-            except ValueError: pass
-        if end_time_str:
-            try:
-                if now.time() > datetime.strptime(end_time_str, "%H:%M").time():
-                    return False
-            except ValueError: pass
-            
         return True
 
     def _playback_loop(self):
@@ -254,9 +550,10 @@ class SignagePlayer:
     def _advance_to_next(self, user_triggered=False):
         # Advance to next valid video
         found = False
-        old_index = self.current_index
+        old_index = index = self.current_index
+        now = datetime.now()  # one clock read for the whole search
         for _ in range(len(self.playlist)):
-            next_index = (self.current_index + 1) % len(self.playlist)
+            next_index = (index + 1) % len(self.playlist)
             
             # If we hit the end, and we're not looping, AND this was an automatic advance, stop.
             # If user explicitly clicked 'Next', we still wrap around even if not looping.
@@ -264,20 +561,32 @@ class SignagePlayer:
             if not self.is_looping and next_index <= old_index and not user_triggered:
                 break
                 
-            self.current_index = next_index
-            if self._is_valid(self.playlist[self.current_index]):
+            index = next_index
+            if self._is_valid(self.playlist[index], now):
                 found = True
                 break
-        
+        self._set_current(index)
+
         if not found:
             self._is_playing_state = False
             self.player.stop()
         else:
             self._play_current()
 
+    def _set_current(self, index: int, playlist: list[dict] | None = None):
+        """Move to index (optionally in a new playlist) as one step for status()."""
+        with self._state_lock:
+            if playlist is not None:
+                self.playlist = playlist
+                self._by_name = {p["filename"]: p for p in playlist}
+            self.current_index = index
+
     def _schedule_checker(self):
         while True:
-            time.sleep(5)
+            self._schedule_event.wait(5 if self._scheduled_count else 30)
+            self._schedule_event.clear()
+            if not self._scheduled_count:
+                continue
             with self._lock:
                 if self._is_playing_state and self.playlist and 0 <= self.current_index < len(self.playlist):
                     curr_item = self.playlist[self.current_index]
@@ -291,17 +600,24 @@ class SignagePlayer:
             return
         
         item = self.playlist[self.current_index]
-        path = str(self.video_dir / item["filename"])
-        media = self.instance.media_new(path)
-        self.player.set_media(media)
+        self._prefetched = False
+        self.player.set_media(self._media_for(item["filename"]))
         self.player.play()
         self._is_playing_state = True
-        
-        def force_fullscreen():
-            time.sleep(0.5)
-            self.player.video_set_aspect_ratio("16:9")
-            self.player.set_fullscreen(True)
-        threading.Thread(target=force_fullscreen, daemon=True).start()
+
+    def _media_for(self, filename: str) -> vlc.Media:
+        """Return the cached VLC media for a file, creating it on first use."""
+        media = self._media.get(filename)
+        if media is None:
+            media = self._media[filename] = self.instance.media_new(str(self.video_dir / filename))
+        return media
+
+    def _drop_media(self, filenames):
+        """Release cached media for files that left the playlist or changed."""
+        for filename in filenames:
+            media = self._media.pop(filename, None)
+            if media is not None:
+                media.release()
 
     # -- Transport controls --------------------------------------------------
 
@@ -312,7 +628,7 @@ class SignagePlayer:
                 
             if index is not None:
                 if 0 <= index < len(self.playlist):
-                    self.current_index = index
+                    self._set_current(index)
                     self._play_current()
                     self._is_playing_state = True
                 else:
@@ -359,11 +675,14 @@ class SignagePlayer:
             self.player.stop()
             # find previous valid
             found = False
+            index = self.current_index
+            now = datetime.now()
             for _ in range(len(self.playlist)):
-                self.current_index = (self.current_index - 1) % len(self.playlist)
-                if self._is_valid(self.playlist[self.current_index]):
+                index = (index - 1) % len(self.playlist)
+                if self._is_valid(self.playlist[index], now):
                     found = True
                     break
+            self._set_current(index)
             if found:
                 self._play_current()
             else:
@@ -381,82 +700,117 @@ class SignagePlayer:
         return {"position": position}
 
     def set_loop(self, loop: bool):
+        if loop == self.is_looping:
+            return {"loop": loop}
         self.is_looping = loop
         self._save_playlist()
         return {"loop": loop}
 
     def set_auto_play(self, auto_play: bool):
+        if auto_play == self.auto_play:
+            return {"auto_play": auto_play}
         self.auto_play = auto_play
         self._save_playlist()
         return {"auto_play": auto_play}
 
     def update_item(self, filename: str, active: bool, schedule: dict):
         with self._lock:
-            for item in self.playlist:
-                if item["filename"] == filename:
-                    if active is not None:
-                        item["active"] = bool(active)
-                    if schedule is not None:
-                        item["schedule"] = schedule
-                    self._save_playlist()
-                    break
-        return self.playlist
+            item = self._by_name.get(filename)
+            if item is not None:
+                if active is not None:
+                    item["active"] = bool(active)
+                if schedule is not None:
+                    item["schedule"] = schedule
+                    self._cache_schedule(item)
+                self._recount_scheduled()
+                self._save_playlist()
+        return self.get_playlist()
 
     # -- Status --------------------------------------------------------------
 
     def status(self) -> dict:
-        state = str(self.player.get_state()).split(".")[-1]
+        return self.status_snapshot()[0]
+
+    def status_snapshot(self) -> tuple[dict, str]:
+        """Return (status, etag), querying VLC at most once per STATUS_CACHE_SEC."""
+        with self._status_lock:
+            now = time.monotonic()
+            if self._status_cache is None or now - self._status_ts >= STATUS_CACHE_SEC:
+                status = self._read_status()
+                if self._status_cache is None or status != self._status_cache[0]:
+                    self._status_generation += 1
+                self._status_cache = (status, f"s{self._status_generation}")
+                self._status_ts = now
+            return self._status_cache
+
+    def _read_status(self) -> dict:
+        # No _lock here: libvlc getters are thread-safe, and the playlist
+        # position is read as one consistent pair under _state_lock
+        with self._state_lock:
+            playlist = self.playlist
+            index = self.current_index
+
+        state = _STATE_NAMES.get(self.player.get_state().value, "Unknown")
         length = self.player.get_length()      # ms
         pos = self.player.get_position()        # 0.0-1.0
         current_time = self.player.get_time()   # ms
         volume = self.player.audio_get_volume()
 
         current_file = ""
-        if self.playlist and 0 <= self.current_index < len(self.playlist):
-            current_file = self.playlist[self.current_index]["filename"]
+        if 0 <= index < len(playlist):
+            current_file = playlist[index]["filename"]
 
         return {
             "state": state,
             "current_file": current_file,
-            "current_index": self.current_index,
+            "current_index": index,
             "length": length,
             "time": current_time,
             "position": pos if pos >= 0 else 0,
             "volume": volume if volume >= 0 else 0,
             "loop": self.is_looping,
             "auto_play": self.auto_play,
-            "playlist_count": len(self.playlist),
+            "playlist_count": len(playlist),
         }
 
     # -- Playlist management -------------------------------------------------
 
     def get_playlist(self) -> list[dict]:
-        return list(self.playlist)
+        return [self._public_item(p) for p in self.playlist]
 
     def add_video(self, filename: str):
         with self._lock:
-            if not any(p["filename"] == filename for p in self.playlist):
-                self.playlist.append({"filename": filename, "active": True, "schedule": {}})
+            # The file may have just been re-uploaded; don't replay stale media
+            self._drop_media([filename])
+            if filename not in self._by_name:
+                item = self._cache_schedule({"filename": filename, "active": True, "schedule": {}})
+                self.playlist.append(item)
+                self._by_name[filename] = item
                 self._save_playlist()
-        return {"playlist": self.playlist}
+        return {"playlist": self.get_playlist()}
 
     def remove_video(self, filename: str):
         with self._lock:
+            if filename not in self._by_name:
+                return {"playlist": self.get_playlist()}
             current_file = None
             if self.playlist and 0 <= self.current_index < len(self.playlist):
                 current_file = self.playlist[self.current_index].get("filename")
 
-            self.playlist = [p for p in self.playlist if p["filename"] != filename]
+            playlist = [p for p in self.playlist if p["filename"] != filename]
+            self._drop_media([filename])
             
-            self.current_index = 0
+            index = 0
             if current_file and current_file != filename:
-                for i, p in enumerate(self.playlist):
+                for i, p in enumerate(playlist):
                     if p.get("filename") == current_file:
-                        self.current_index = i
+                        index = i
                         break
+            self._set_current(index, playlist)
                         
+            self._recount_scheduled()
             self._save_playlist()
-        return {"playlist": self.playlist}
+        return {"playlist": self.get_playlist()}
 
     def reorder_playlist(self, new_order: list):
         with self._lock:
@@ -464,23 +818,29 @@ class SignagePlayer:
             if self.playlist and 0 <= self.current_index < len(self.playlist):
                 current_file = self.playlist[self.current_index].get("filename")
 
+            existing = self._files_on_disk()
             valid = []
             for item in new_order:
-                if isinstance(item, str) and (self.video_dir / item).is_file():
+                if isinstance(item, str) and item in existing:
                     valid.append({"filename": item, "active": True, "schedule": {}})
-                elif isinstance(item, dict) and "filename" in item and (self.video_dir / item["filename"]).is_file():
-                    valid.append(item)
-            self.playlist = valid
-            
-            self.current_index = 0
+                elif isinstance(item, dict) and item.get("filename") in existing:
+                    valid.append(self._cache_schedule(item))
+            # An unchanged drag-drop must not reset media or rewrite the file
+            current = self.get_playlist()
+            if [self._public_item(p) for p in valid] == current:
+                return {"playlist": current}
+            index = 0
             if current_file:
-                for i, p in enumerate(self.playlist):
+                for i, p in enumerate(valid):
                     if p.get("filename") == current_file:
-                        self.current_index = i
+                        index = i
                         break
+            self._set_current(index, valid)
+            self._drop_media(set(self._media) - {p["filename"] for p in valid})
                         
+            self._recount_scheduled()
             self._save_playlist()
-        return {"playlist": self.playlist}
+        return {"playlist": self.get_playlist()}
 
     def delete_video_file(self, filename: str):
         self.remove_video(filename)
@@ -490,18 +850,102 @@ class SignagePlayer:
         return {"deleted": filename}
 
     def release(self):
+        try:
+            self._flush_playlist()
+        except OSError as e:
+            print(f"Error saving playlist: {e}")
         try:
             self.player.stop()
             self.player.release()
+            self._drop_media(list(self._media))
             self.instance.release()
             print("VLC resources released.")
         except Exception as e:
             print(f"Error releasing VLC: {e}")
 
+# ---------------------------------------------------------------------------
+# Status push (Server-Sent Events)
+# ---------------------------------------------------------------------------
+
+class StatusBroadcaster:
+    """Fans one status query per tick out to every connected SSE client."""
+
+    def __init__(self, player: SignagePlayer, interval: float):
+        self._player = player
+        self._interval = interval
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    @staticmethod
+    def _message(status: dict) -> bytes:
+        return b"data: " + orjson.dumps(status) + b"\n\n"
+
+    @staticmethod
+    def _replace(q: queue.Queue, message: bytes | None):
+        """Swap the queued frame for message rather than block on a slow client."""
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put_nowait(message)
+
+    def subscribe(self) -> queue.Queue:
+        """Register a client; its queue starts with the current status."""
+        q = queue.Queue(maxsize=1)
+        q.put_nowait(self._message(self._player.status()))
+        with self._lock:
+            if self._closed:
+                self._replace(q, None)
+                return q
+            self._subscribers.add(q)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._publish_loop, daemon=True)
+                self._thread.start()
+        return q
+
+    def unsubscribe(self, q: queue.Queue):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def close(self):
+        """End every stream so server threads can exit at shutdown.
+
+        Streams receive None, which the SSE generator treats as the end.
+        """
+        with self._lock:
+            self._closed = True
+            for q in self._subscribers:
+                self._replace(q, None)
+
+    def _publish_loop(self):
+        last_tag = None
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                subscribers = list(self._subscribers)
+            if not subscribers:
+                continue
+            status, tag = self._player.status_snapshot()
+            if tag == last_tag:
+                continue
+            last_tag = tag
+            message = self._message(status)
+            with self._lock:
+                # Checked under the lock so a frame never overwrites the
+                # end-of-stream marker close() queued
+                if self._closed:
+                    return
+                for q in subscribers:
+                    self._replace(q, message)
+
+
 # ---------------------------------------------------------------------------
 # Initialise player
 # ---------------------------------------------------------------------------
 player = SignagePlayer(VIDEO_DIR, PLAYLIST_FILE)
+status_broadcaster = StatusBroadcaster(player, STATUS_PUSH_INTERVAL)
 
 
 # ---------------------------------------------------------------------------
@@ -517,23 +961,45 @@ def login_required(f):
     return decorated_function
 
 
+_CSRF_PLACEHOLDER = "__csrf_token__"
+_login_pages: dict[str | None, tuple[bytes, bytes]] = {}
+
+
+def _login_page(error: str | None = None) -> Response:
+    """Serve login.html from a per-error prerendered copy.
+
+    The page only varies by the error message and the CSRF token, so it is
+    rendered once per message and the token is spliced in per request.
+    """
+    parts = _login_pages.get(error)
+    if parts is None:
+        html = app.jinja_env.get_template("login.html").render(
+            error=error, csrf_token=_CSRF_PLACEHOLDER
+        ).encode()
+        head, _, tail = html.partition(_CSRF_PLACEHOLDER.encode())
+        parts = _login_pages[error] = (head, tail)
+    head, tail = parts
+    return Response(head + _csrf_token().encode() + tail, mimetype="text/html")
+
+
 @app.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
         client_ip = request.remote_addr or "unknown"
         if _is_rate_limited(client_ip):
-            return render_template("login.html", error="Too many attempts. Try again in 5 minutes.")
+            return _login_page("Too many attempts. Try again in 5 minutes.")
         username = request.form.get("username", "")
         password = request.form.get("password", "")
-        if username == USERNAME and check_password_hash(PASSWORD_HASH, password):
+        if _check_credentials(username, password):
             session["logged_in"] = True
             session["user"] = username
+            session["csrf_token"] = secrets.token_hex(32)
             # Clear failed attempts on success
-            _login_attempts.pop(client_ip, None)
+            _clear_attempts(client_ip)
             return redirect(url_for("index"))
         _record_attempt(client_ip)
-        return render_template("login.html", error="Invalid credentials")
-    return render_template("login.html")
+        return _login_page("Invalid credentials")
+    return _login_page()
 
 
 @app.route("/logout")
@@ -550,10 +1016,11 @@ def api_login():
         return jsonify({"error": "Too many attempts. Try again in 5 minutes."}), 429
     username = data.get("username", "")
     password = data.get("password", "")
-    if username == USERNAME and check_password_hash(PASSWORD_HASH, password):
+    if _check_credentials(username, password):
         session["logged_in"] = True
         session["user"] = username
-        _login_attempts.pop(client_ip, None)
+        session["csrf_token"] = secrets.token_hex(32)
+        _clear_attempts(client_ip)
         return jsonify({"status": "ok"})
     _record_attempt(client_ip)
     return jsonify({"error": "Invalid credentials"}), 401
@@ -584,6 +1051,30 @@ def index():
 # Flask Routes  --  REST API
 # ---------------------------------------------------------------------------
 
+# Counters behind the ETags restart with the process; the boot id keeps a
+# tag from a previous run from matching
+_ETAG_BOOT_ID = secrets.token_hex(4)
+
+
+def _json_response(payload) -> Response:
+    """Serialize straight to bytes with orjson, skipping jsonify's provider layer."""
+    return Response(orjson.dumps(payload), mimetype="application/json")
+
+
+def _not_modified(tag: str):
+    """Return a 304 if the client already holds this ETag, otherwise None."""
+    if request.if_none_match.contains(f"{_ETAG_BOOT_ID}-{tag}"):
+        return _with_etag(Response(status=304), tag)
+    return None
+
+
+def _with_etag(response, tag: str):
+    """Tag a response and make browsers revalidate it on every poll."""
+    response.set_etag(f"{_ETAG_BOOT_ID}-{tag}")
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 # -- Transport --
 
 @app.route("/api/play", methods=["POST"])
@@ -657,7 +1148,34 @@ def api_auto_play():
 @app.route("/api/status")
 @login_required
 def api_status():
-    return jsonify(player.status())
+    status, tag = player.status_snapshot()
+    return _not_modified(tag) or _with_etag(_json_response(status), tag)
+
+
+@app.route("/api/status/stream")
+@login_required
+def api_status_stream():
+    """Push status changes as Server-Sent Events instead of being polled."""
+    q = status_broadcaster.subscribe()
+
+    def stream():
+        try:
+            while True:
+                try:
+                    message = q.get(timeout=15)
+                except queue.Empty:
+                    yield b": keep-alive\n\n"  # lets dead connections be noticed
+                    continue
+                if message is None:  # server shutting down
+                    return
+                yield message
+        finally:
+            status_broadcaster.unsubscribe(q)
+
+    return Response(stream(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # stop Nginx from buffering the stream
+    })
 
 
 # -- Playlist --
@@ -665,7 +1183,8 @@ def api_status():
 @app.route("/api/playlist")
 @login_required
 def api_playlist():
-    return jsonify({"playlist": player.get_playlist()})
+    tag = f"p{player.playlist_version}"
+    return _not_modified(tag) or _with_etag(_json_response({"playlist": player.get_playlist()}), tag)
 
 
 @app.route("/api/playlist/reorder", methods=["POST"])
@@ -702,14 +1221,214 @@ def api_upload():
     if "file" not in request.files:
         return jsonify({"error": "No file provided"}), 400
     f = request.files["file"]
-    if f.filename == "":
-        return jsonify({"error": "Empty filename"}), 400
-    ext = f.filename.rsplit(".", 1)[-1].lower() if "." in f.filename else ""
+    filename, error = _check_upload_name(f.filename or "")
+    if error:
+        return error
+    dest = VIDEO_DIR / filename
+    # Copy the spooled upload in 1 MB blocks instead of the 16 kB default
+    f.save(str(dest), buffer_size=UPLOAD_BUFFER_SIZE)
+    _invalidate_video_listing()
+    player.add_video(filename)
+    return jsonify({"uploaded": filename, "playlist": player.get_playlist()})
+
+
+def _stream_to_file(stream, dest: Path, length: int) -> bool:
+    """Write a request body to dest in large blocks, fsync, then rename it into place.
+
+    Returns False, leaving dest untouched, if fewer than ``length`` bytes
+    arrived. Under Gunicorn a dropped client just ends the stream early
+    instead of raising, so the byte count is the only reliable signal.
+    """
+    written = 0
+    tmp = dest.with_name(f".{dest.name}.part")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while True:
+            buf = stream.read(UPLOAD_BUFFER_SIZE)
+            if not buf:
+                break
+            written += len(buf)
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+        if written == length:
+            os.fsync(fd)
+    except BaseException:
+        # Don't leave a truncated file behind if the client disconnects
+        os.close(fd)
+        tmp.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    if written != length:
+        tmp.unlink(missing_ok=True)
+        return False
+    os.replace(tmp, dest)
+    return True
+
+
+def _check_upload_name(raw_name: str):
+    """Return (filename, None) for an acceptable upload name, else (None, error response)."""
+    # Validate the sanitised name, since that is what gets saved
+    filename = secure_filename(raw_name)
+    if not filename:
+        return None, (jsonify({"error": "Empty filename"}), 400)
+    _, dot, ext = filename.rpartition(".")
+    ext = ext.lower() if dot else ""
     if ext not in ALLOWED_EXTENSIONS:
-        return jsonify({"error": f"File type .{ext} not allowed"}), 400
-    filename = secure_filename(f.filename)
+        return None, (jsonify({"error": f"File type .{ext} not allowed"}), 400)
+    return filename, None
+
+
+@app.route("/api/upload-raw", methods=["PUT", "POST"])
+@login_required
+def api_upload_raw():
+    """Receive a video as the raw request body, bypassing multipart parsing.
+
+    The filename comes from the ``filename`` query parameter or an
+    ``X-Filename`` header.
+    """
+    raw_name = request.args.get("filename") or request.headers.get("X-Filename", "")
+    filename, error = _check_upload_name(raw_name)
+    if error:
+        return error
+    if request.content_length is None:
+        return jsonify({"error": "Content-Length required"}), 411
     dest = VIDEO_DIR / filename
-    f.save(str(dest))
+    if not _stream_to_file(request.stream, dest, request.content_length):
+        return jsonify({"error": "Upload incomplete"}), 400
+    _invalidate_video_listing()
+    player.add_video(filename)
+    return jsonify({"uploaded": filename, "playlist": player.get_playlist()})
+
+
+# -- Chunked (resumable) uploads --
+
+_UPLOAD_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def _upload_parts_dir(upload_id: str) -> Path | None:
+    """Directory holding the parts of a chunked upload, or None for a bad id."""
+    if not _UPLOAD_ID_RE.match(upload_id):
+        return None
+    return UPLOAD_PARTS_DIR / upload_id
+
+
+def _write_upload_meta(parts_dir: Path, meta: dict):
+    """Record an upload's metadata once; parallel chunks must not rewrite it."""
+    path = parts_dir / "upload.json"
+    if path.exists():
+        return
+    # Each writer uses its own temp file and renames it into place, so a
+    # reader never sees a half-written file
+    tmp = parts_dir / f".upload.{secrets.token_hex(4)}.json"
+    tmp.write_bytes(orjson.dumps(meta))
+    os.replace(tmp, path)
+
+
+def _sweep_stale_uploads():
+    """Remove chunked uploads that have not received a chunk in a long time."""
+    cutoff = time.time() - UPLOAD_PARTS_MAX_AGE
+    try:
+        with os.scandir(UPLOAD_PARTS_DIR) as it:
+            stale = [e.path for e in it if e.is_dir() and e.stat().st_mtime < cutoff]
+    except FileNotFoundError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _received_chunks(parts_dir: Path) -> list[int]:
+    if not parts_dir.is_dir():
+        return []
+    with os.scandir(parts_dir) as it:
+        return sorted(int(e.name) for e in it if e.name.isdigit())
+
+
+@app.route("/api/upload/chunk", methods=["GET"])
+@login_required
+def api_upload_chunk_status():
+    """List the chunks already received, so an interrupted upload can resume."""
+    parts_dir = _upload_parts_dir(request.args.get("uploadId", ""))
+    if parts_dir is None:
+        return jsonify({"error": "Invalid uploadId"}), 400
+    return jsonify({"received": _received_chunks(parts_dir)})
+
+
+@app.route("/api/upload/chunk", methods=["POST"])
+@login_required
+def api_upload_chunk():
+    """Store one chunk of a large upload, sent as the raw request body.
+
+    Query parameters: ``uploadId``, ``chunkIndex``, ``totalChunks`` and
+    ``filename``. Chunks may arrive in any order and in parallel.
+    """
+    parts_dir = _upload_parts_dir(request.args.get("uploadId", ""))
+    if parts_dir is None:
+        return jsonify({"error": "Invalid uploadId"}), 400
+    try:
+        index = int(request.args.get("chunkIndex", ""))
+        total = int(request.args.get("totalChunks", ""))
+    except ValueError:
+        return jsonify({"error": "Invalid chunkIndex or totalChunks"}), 400
+    if not 0 < total <= MAX_UPLOAD_CHUNKS or not 0 <= index < total:
+        return jsonify({"error": "Invalid chunkIndex or totalChunks"}), 400
+    filename, error = _check_upload_name(request.args.get("filename", ""))
+    if error:
+        return error
+
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    _write_upload_meta(parts_dir, {"filename": filename, "total_chunks": total})
+    if request.content_length is None:
+        return jsonify({"error": "Content-Length required"}), 411
+    if not _stream_to_file(request.stream, parts_dir / str(index), request.content_length):
+        return jsonify({"error": "Chunk incomplete"}), 400
+    return jsonify({"received": index})
+
+
+@app.route("/api/upload/complete", methods=["POST"])
+@login_required
+def api_upload_complete():
+    """Assemble the chunks of an upload into the video directory."""
+    data = request.get_json(silent=True) or {}
+    parts_dir = _upload_parts_dir(str(data.get("uploadId", "")))
+    if parts_dir is None:
+        return jsonify({"error": "Invalid uploadId"}), 400
+    try:
+        meta = orjson.loads((parts_dir / "upload.json").read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return jsonify({"error": "Unknown upload"}), 404
+    filename = meta["filename"]
+    total = meta["total_chunks"]
+    missing = sorted(set(range(total)) - set(_received_chunks(parts_dir)))
+    if missing:
+        return jsonify({"error": "Missing chunks", "missing": missing}), 400
+    if sum((parts_dir / str(i)).stat().st_size for i in range(total)) > app.config["MAX_CONTENT_LENGTH"]:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        return jsonify({"error": "File too large"}), 413
+
+    # Splice each part into a temp file in-kernel, then move it into place
+    tmp = VIDEO_DIR / f".{filename}.part"
+    out_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for index in range(total):
+            in_fd = os.open(parts_dir / str(index), os.O_RDONLY)
+            try:
+                offset = 0
+                size = os.fstat(in_fd).st_size
+                while offset < size:
+                    offset += os.sendfile(out_fd, in_fd, offset, size - offset)
+            finally:
+                os.close(in_fd)
+        os.fsync(out_fd)
+    except BaseException:
+        os.close(out_fd)
+        tmp.unlink(missing_ok=True)
+        raise
+    os.close(out_fd)
+    os.replace(tmp, VIDEO_DIR / filename)
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    _sweep_stale_uploads()
+
     player.add_video(filename)
     return jsonify({"uploaded": filename, "playlist": player.get_playlist()})
 
@@ -724,24 +1443,72 @@ def api_delete():
     return jsonify(player.delete_video_file(filename))
 
 
+# The listing is rebuilt only when the directory's mtime moves (files
+# added, removed or renamed) or after one of our own uploads overwrote a
+# file in place, which doesn't touch the directory
+_video_listing_cache = {"mtime": None, "files": [], "tag": ""}
+_video_listing_lock = threading.Lock()
+
+
+def _invalidate_video_listing():
+    with _video_listing_lock:
+        _video_listing_cache["mtime"] = None
+
+
+def _video_listing() -> tuple[list[dict], str]:
+    """Return (files, etag) for the video directory, rescanning only on change."""
+    mtime = VIDEO_DIR.stat().st_mtime_ns
+    with _video_listing_lock:
+        if _video_listing_cache["mtime"] != mtime:
+            listing = [(e.name, e.stat()) for e in player._sorted_video_entries(VIDEO_DIR)]
+            files = []
+            for name, st in listing:
+                size_mb = st.st_size / (1024 * 1024)
+                files.append({"name": name, "size_mb": round(size_mb, 2)})
+            key = tuple((name, st.st_size, st.st_mtime_ns) for name, st in listing)
+            _video_listing_cache["files"] = files
+            _video_listing_cache["tag"] = "v%x" % (hash(key) & 0xFFFFFFFFFFFFFFFF)
+            _video_listing_cache["mtime"] = mtime
+        return _video_listing_cache["files"], _video_listing_cache["tag"]
+
+
 @app.route("/api/videos")
 @login_required
 def api_videos():
     """List all video files on disk (may differ from playlist)."""
-    files = []
-    for f in sorted(VIDEO_DIR.iterdir()):
-        if f.suffix.lstrip(".").lower() in ALLOWED_EXTENSIONS:
-            size_mb = f.stat().st_size / (1024 * 1024)
-            files.append({"name": f.name, "size_mb": round(size_mb, 2)})
-    return jsonify({"videos": files})
+    files, tag = _video_listing()
+    return _not_modified(tag) or _with_etag(_json_response({"videos": files}), tag)
+
+
+@app.route("/videos/<path:name>")
+@login_required
+def video_file(name):
+    """Serve a video file; the WSGI server sends it with sendfile(2)."""
+    return send_from_directory(VIDEO_DIR, name, conditional=True)
 
 
 # -- System info --
 
+_SYSINFO_CACHE_SEC = 1.5
+_sysinfo_cache = {"at": 0.0, "data": None}
+_sysinfo_lock = threading.Lock()
+_MEMINFO_RE = re.compile(rb"^(MemTotal|MemFree|MemAvailable):\s+(\d+)", re.MULTILINE)
+
+
 @app.route("/api/system-info")
 @login_required
 def api_system_info():
     """Return system information: disk, CPU, memory, temperature."""
+    with _sysinfo_lock:
+        now = time.monotonic()
+        if _sysinfo_cache["data"] is None or now - _sysinfo_cache["at"] >= _SYSINFO_CACHE_SEC:
+            _sysinfo_cache["data"] = _collect_system_info()
+            _sysinfo_cache["at"] = now
+        return jsonify(_sysinfo_cache["data"])
+
+
+def _collect_system_info() -> dict:
+    """Read disk, CPU, memory, temperature and uptime figures."""
     info = {}
 
     # Disk usage for video directory
@@ -772,12 +1539,10 @@ def api_system_info():
 
     # Memory usage from /proc/meminfo (Linux only)
     try:
-        meminfo = Path("/proc/meminfo").read_text()
-        mem = {}
-        for line in meminfo.splitlines():
-            parts = line.split()
-            if parts[0] in ("MemTotal:", "MemAvailable:", "MemFree:"):
-                mem[parts[0].rstrip(":")] = int(parts[1])  # kB
+        # MemTotal, MemFree and MemAvailable are the first three lines
+        with open("/proc/meminfo", "rb") as f:
+            head = f.read(512)
+        mem = {key.decode(): int(kb) for key, kb in _MEMINFO_RE.findall(head)}  # kB
         total = mem.get("MemTotal", 0)
         available = mem.get("MemAvailable", mem.get("MemFree", 0))
         used = total - available
@@ -803,7 +1568,8 @@ def api_system_info():
 
     # Uptime
     try:
-        uptime_sec = float(Path("/proc/uptime").read_text().split()[0])
+        with open("/proc/uptime", "rb") as f:
+            uptime_sec = float(f.read(32).split()[0])
         days = int(uptime_sec // 86400)
         hours = int((uptime_sec % 86400) // 3600)
         minutes = int((uptime_sec % 3600) // 60)
@@ -814,31 +1580,41 @@ def api_system_info():
     except Exception:
         info["uptime"] = None
 
-    return jsonify(info)
+    return info
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-if __name__ == "__main__":
-    # Signal handling for standalone mode
-    def signal_handler(sig, frame):
-        print("\nShutting down...")
-        player.release()
-        sys.exit(0)
+# Ensure VLC cleanup both under the standalone server and Gunicorn/WSGI,
+# which kills workers with SIGTERM.
+atexit.register(player.release)
+_sweep_stale_uploads()
+
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+def signal_handler(sig, frame):
+    print("\nShutting down...")
+    # Open SSE streams would otherwise keep worker threads, and thus the
+    # interpreter, alive past systemd's stop timeout
+    status_broadcaster.close()
+    sys.exit(0)  # atexit hook releases VLC
+
+
+signal.signal(signal.SIGINT, signal_handler)
+signal.signal(signal.SIGTERM, signal_handler)
+
+if __name__ == "__main__":
+    # Waitress keeps connections alive between dashboard polls, unlike the
+    # Werkzeug development server. It serves in-process, so the VLC player
+    # and its background threads created above stay with the app.
+    from waitress import serve
 
     print("=" * 60)
     print("  Raspberry Pi Video Signage Player")
     print("  Open http://<raspi-ip>:5000 in your browser")
     print("=" * 60)
     # Use 0.0.0.0 so it's accessible from other devices on the network
-    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
-else:
-    # Logic for Gunicorn/WSGI
-    # We use this to ensure cleanup when gunicorn kills workers
-    import atexit
-    atexit.register(player.release)
+    # Waitress caps request bodies at 1 GiB by default; match our own limit
+    serve(app, host="0.0.0.0", port=5000, threads=16,
+          max_request_body_size=app.config["MAX_CONTENT_LENGTH"])
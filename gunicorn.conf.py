@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the production (Nginx) deployment.
+
+Run with:  gunicorn -c gunicorn.conf.py app:app
+"""
+
+bind = "0.0.0.0:5000"
+
+# A single worker owns the VLC player; threads serve the dashboard.
+# gevent is deliberately not used: its monkey-patching does not mix with
+# the callbacks libvlc fires from its own native threads. Each open
+# /api/status/stream holds a thread, so leave room for several dashboards.
+workers = 1
+worker_class = "gthread"
+threads = 16
+keepalive = 5
+
+# Heartbeat files on tmpfs instead of the SD card.
+worker_tmp_dir = "/dev/shm"
+
+limit_request_line = 8192
+
+# Let the kernel copy files served from /videos straight to the socket.
+sendfile = True
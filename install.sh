@@ -46,7 +46,7 @@ echo -e "${CYAN}============================================${NC}"
 # 1. Ask for deployment mode
 echo ""
 echo "Select deployment mode:"
-echo "  1) Development (Flask built-in server, port 5000)"
+echo "  1) Development (Waitress server, port 5000)"
 echo "  2) Production (Gunicorn + Nginx, port 80)"
 echo ""
 read -p "Enter choice [1-2] (default: 1): " DEPLOY_MODE
@@ -177,7 +177,7 @@ After=network.target graphical.target
 Type=simple
 User=$(whoami)
 WorkingDirectory=${SCRIPT_DIR}
-ExecStart=/bin/bash ${SCRIPT_DIR}/run.sh ${SCRIPT_DIR}/venv/bin/gunicorn --workers 1 --threads 4 --bind 0.0.0.0:5000 app:app
+ExecStart=/bin/bash ${SCRIPT_DIR}/run.sh ${SCRIPT_DIR}/venv/bin/gunicorn -c ${SCRIPT_DIR}/gunicorn.conf.py app:app
 Restart=always
 RestartSec=5
 TimeoutStopSec=5
@@ -186,7 +186,7 @@ TimeoutStopSec=5
 WantedBy=multi-user.target
 EOF
 else
-    # Development: Flask built-in server
+    # Development: standalone Waitress server
     sudo tee /etc/systemd/system/${SERVICE_NAME}.service > /dev/null <<EOF
 [Unit]
 Description=Raspberry Pi Video Signage Player
@@ -255,7 +255,7 @@ echo -e "${GREEN}============================================${NC}\n"
 if [ "$PRODUCTION_MODE" = true ]; then
     echo -e "  Mode: ${CYAN}PRODUCTION (Gunicorn + Nginx)${NC}"
 else
-    echo -e "  Mode: ${CYAN}DEVELOPMENT (Flask built-in)${NC}"
+    echo -e "  Mode: ${CYAN}DEVELOPMENT (Waitress)${NC}"
 fi
 
 echo -e "\n  ${YELLOW}Credentials:${NC}"
@@ -65,13 +65,10 @@ const progressFill = document.getElementById("progressFill");
 const progressText = document.getElementById("progressText");
 
 // ---------------------------------------------------------------------------
-// Status polling
+// Status updates (Server-Sent Events, polling as fallback)
 // ---------------------------------------------------------------------------
 
-async function pollStatus() {
-    const data = await apiCall("/api/status");
-    if (data.error) return;
-
+function renderStatus(data) {
     // State badge
     currentState = data.state;
     statusBadge.textContent = data.state;
@@ -111,8 +108,34 @@ async function pollStatus() {
     autoPlayBtn.classList.toggle("active", isAutoPlay);
 }
 
-setInterval(pollStatus, 1000);
-pollStatus();
+async function pollStatus() {
+    const data = await apiCall("/api/status");
+    if (data.error) return;
+    renderStatus(data);
+}
+
+let statusPollTimer = null;
+
+function startStatusPolling() {
+    if (statusPollTimer) return;
+    statusPollTimer = setInterval(pollStatus, 1000);
+    pollStatus();
+}
+
+function startStatusUpdates() {
+    if (!window.EventSource) {
+        startStatusPolling();
+        return;
+    }
+    const source = new EventSource("/api/status/stream");
+    source.onmessage = (e) => renderStatus(JSON.parse(e.data));
+    source.onerror = () => {
+        // The browser reconnects on its own; fall back only if it gave up
+        if (source.readyState === EventSource.CLOSED) startStatusPolling();
+    };
+}
+
+startStatusUpdates();
 
 // ---------------------------------------------------------------------------
 // System info polling
@@ -415,7 +438,11 @@ fileInput.addEventListener("change", () => {
 
 async function uploadFiles(files) {
     for (const file of files) {
-        await uploadSingleFile(file);
+        if (file.size > CHUNK_SIZE) {
+            await uploadChunkedFile(file);
+        } else {
+            await uploadSingleFile(file);
+        }
     }
     loadPlaylist();
     refreshFiles();
@@ -423,9 +450,6 @@ async function uploadFiles(files) {
 
 function uploadSingleFile(file) {
     return new Promise((resolve) => {
-        const formData = new FormData();
-        formData.append("file", file);
-
         const xhr = new XMLHttpRequest();
         uploadProgress.style.display = "flex";
 
@@ -453,13 +477,82 @@ function uploadSingleFile(file) {
             resolve();
         });
 
-        xhr.open("POST", "/api/upload");
+        // Send the raw file body; the server streams it straight to disk
+        xhr.open("PUT", "/api/upload-raw?filename=" + encodeURIComponent(file.name));
         const csrfToken = document.querySelector('meta[name="csrf-token"]')?.content || "";
         xhr.setRequestHeader("X-CSRF-Token", csrfToken);
-        xhr.send(formData);
+        xhr.setRequestHeader("Content-Type", "application/octet-stream");
+        xhr.send(file);
     });
 }
 
+// Large files go up in chunks: several in flight, and a retry of the same
+// file only sends the chunks the server doesn't have yet
+const CHUNK_SIZE = 8 * 1024 * 1024;
+const CHUNK_PARALLEL = 3;
+
+function uploadIdFor(file) {
+    // Stable across retries of the same file (FNV-1a of the name)
+    let hash = 2166136261;
+    for (let i = 0; i < file.name.length; i++) {
+        hash = Math.imul(hash ^ file.name.charCodeAt(i), 16777619) >>> 0;
+    }
+    return `${file.size}-${file.lastModified}-${hash.toString(16)}`;
+}
+
+async function uploadChunkedFile(file) {
+    const csrfToken = document.querySelector('meta[name="csrf-token"]')?.content || "";
+    const uploadId = uploadIdFor(file);
+    const total = Math.ceil(file.size / CHUNK_SIZE);
+    const query = `uploadId=${uploadId}&totalChunks=${total}&filename=${encodeURIComponent(file.name)}`;
+
+    uploadProgress.style.display = "flex";
+    const status = await apiCall(`/api/upload/chunk?uploadId=${uploadId}`);
+    const received = new Set(status.received || []);
+    const pending = [];
+    for (let i = 0; i < total; i++) {
+        if (!received.has(i)) pending.push(i);
+    }
+
+    let done = received.size;
+    const showProgress = () => {
+        const pct = Math.round((done / total) * 100);
+        progressFill.style.width = pct + "%";
+        progressText.textContent = pct + "%";
+    };
+    showProgress();
+
+    async function sendChunks() {
+        while (pending.length) {
+            const i = pending.shift();
+            const res = await fetch(`/api/upload/chunk?${query}&chunkIndex=${i}`, {
+                method: "POST",
+                headers: { "X-CSRF-Token": csrfToken, "Content-Type": "application/octet-stream" },
+                body: file.slice(i * CHUNK_SIZE, (i + 1) * CHUNK_SIZE),
+            });
+            if (!res.ok) throw new Error(`Chunk ${i} failed`);
+            done++;
+            showProgress();
+        }
+    }
+
+    try {
+        await Promise.all(Array.from({ length: CHUNK_PARALLEL }, sendChunks));
+        const result = await apiCall("/api/upload/complete", "POST", { uploadId });
+        if (result.error) throw new Error(result.error);
+        progressFill.style.width = "100%";
+        progressText.textContent = "Done!";
+        setTimeout(() => {
+            uploadProgress.style.display = "none";
+            progressFill.style.width = "0%";
+        }, 1500);
+    } catch (err) {
+        console.error("Upload error:", err);
+        progressText.textContent = "Error!";
+        setTimeout(() => { uploadProgress.style.display = "none"; }, 2000);
+    }
+}
+
 // ---------------------------------------------------------------------------
 // Files on disk
 // ---------------------------------------------------------------------------